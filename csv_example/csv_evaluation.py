@@ -1,19 +1,15 @@
-from future.utils import viewitems
-
 import csv
 import collections
 import itertools
 
 def evaluateDuplicates(found_dupes, true_dupes):
     true_positives = found_dupes.intersection(true_dupes)
-    false_positives = found_dupes.difference(true_dupes)
-    uncovered_dupes = true_dupes.difference(found_dupes)
 
     print('found duplicate')
     print(len(found_dupes))
 
     print('precision')
-    print(1 - len(false_positives) / float(len(found_dupes)))
+    print(len(true_positives) / float(len(found_dupes)))
 
     print('recall')
     print(len(true_positives) / float(len(true_dupes)))
@@ -30,11 +26,10 @@ def dupePairs(filename, rowname) :
     if 'x' in dupe_d :
         del dupe_d['x']
 
-    dupe_s = set([])
-    for (unique_id, cluster) in viewitems(dupe_d) :
-        if len(cluster) > 1:
-            for pair in itertools.combinations(cluster, 2):
-                dupe_s.add(frozenset(pair))
+    dupe_s = {frozenset(pair)
+              for cluster in dupe_d.values()
+              if len(cluster) > 1
+              for pair in itertools.combinations(cluster, 2)}
 
     return dupe_s
 
@@ -19,19 +19,28 @@ import csv
 import re
 import logging
 import optparse
+import functools
 
 import dedupe
 from unidecode import unidecode
 
 
+MULTI_SPACE_RE = re.compile('  +')
+NEWLINE_RE = re.compile('\n')
+
+
+@functools.lru_cache(maxsize=None)
 def preProcess(column):
     """
     Do a little bit of data cleaning with the help of Unidecode and Regex.
     Things like casing, extra spaces, quotes and new lines can be ignored.
+
+    Columns like Zip and Phone repeat the same raw values many times, so
+    the cleaning is memoized on the raw string.
     """
     column = unidecode(column)
-    column = re.sub('  +', ' ', column)
-    column = re.sub('\n', ' ', column)
+    column = MULTI_SPACE_RE.sub(' ', column)
+    column = NEWLINE_RE.sub(' ', column)
     column = column.strip().strip('"').strip("'").lower().strip()
     # If data is missing, indicate that by setting the value to `None`
     if not column:
@@ -49,9 +58,9 @@ def readData(filename):
     with open(filename) as f:
         reader = csv.DictReader(f)
         for row in reader:
-            clean_row = [(k, preProcess(v)) for (k, v) in row.items()]
+            clean_row = {k: preProcess(v) for (k, v) in row.items()}
             row_id = int(row['Id'])
-            data_d[row_id] = dict(clean_row)
+            data_d[row_id] = clean_row
 
     return data_d
 
@@ -91,7 +100,7 @@ if __name__ == '__main__':
     if os.path.exists(settings_file):
         print('reading from', settings_file)
         with open(settings_file, 'rb') as f:
-            deduper = dedupe.StaticDedupe(f)
+            deduper = dedupe.StaticDedupe(f, num_cores=4)
     else:
         # ## Training
 
@@ -104,7 +113,7 @@ if __name__ == '__main__':
             ]
 
         # Create a new deduper object and pass our data model to it.
-        deduper = dedupe.Dedupe(fields)
+        deduper = dedupe.Dedupe(fields, num_cores=4)
 
         # If we have training data saved from a previous run of dedupe,
         # look for it and load it in.
@@ -158,10 +167,7 @@ if __name__ == '__main__':
     cluster_membership = {}
     for cluster_id, (records, scores) in enumerate(clustered_dupes):
         for record_id, score in zip(records, scores):
-            cluster_membership[record_id] = {
-                "Cluster ID": cluster_id,
-                "confidence_score": score
-            }
+            cluster_membership[record_id] = (cluster_id, score)
 
     with open(output_file, 'w') as f_output, open(input_file) as f_input:
 
@@ -171,7 +177,12 @@ if __name__ == '__main__':
         writer = csv.DictWriter(f_output, fieldnames=fieldnames)
         writer.writeheader()
 
-        for row in reader:
-            row_id = int(row['Id'])
-            row.update(cluster_membership[row_id])
-            writer.writerow(row)
+        def annotated_rows():
+            for row in reader:
+                row_id = int(row['Id'])
+                cluster_id, score = cluster_membership[row_id]
+                row['Cluster ID'] = cluster_id
+                row['confidence_score'] = score
+                yield row
+
+        writer.writerows(annotated_rows())
@@ -9,20 +9,29 @@ import csv
 import re
 import logging
 import optparse
+import functools
 
 import unidecode
 
 import dedupe
 
 
+MULTI_SPACE_RE = re.compile('  +')
+NEWLINE_RE = re.compile('\n')
+
+
+@functools.lru_cache(maxsize=None)
 def preProcess(column):
     """
     Do a little bit of data cleaning with the help of Unidecode and Regex.
     Things like casing, extra spaces, quotes and new lines can be ignored.
+
+    Columns like City, State and Zip repeat the same raw values many
+    times, so the cleaning is memoized on the raw string.
     """
     column = unidecode.unidecode(column)
-    column = re.sub('  +', ' ', column)
-    column = re.sub('\n', ' ', column)
+    column = MULTI_SPACE_RE.sub(' ', column)
+    column = NEWLINE_RE.sub(' ', column)
     column = column.strip().strip('"').strip("'").lower().strip()
     return column
 
@@ -40,19 +49,12 @@ def readData(filename):
             clean_row = {k: preProcess(v) for (k, v) in row.items()}
             clean_row['name'] = ' '.join([clean_row['FirstName'],
                                           clean_row['LastName']])
-            if not clean_row['name']:
-                clean_row['name'] = None
             clean_row['address'] = ' '.join([clean_row['Address1'],
                                              clean_row['Address2']])
-            if not clean_row['address']:
-                clean_row['address'] = None
             row_id = int(row['ID'])
 
-            for k, v in clean_row.items():
-                if not v:
-                    clean_row[k] = None
-
-            data_d[row_id] = clean_row
+            data_d[row_id] = {k: v if v else None
+                              for k, v in clean_row.items()}
 
     return data_d
 
@@ -92,7 +94,7 @@ if __name__ == '__main__':
     if os.path.exists(settings_file):
         print('reading from', settings_file)
         with open(settings_file, 'rb') as f:
-            deduper = dedupe.StaticDedupe(f)
+            deduper = dedupe.StaticDedupe(f, num_cores=4)
 
     else:
         # Define the fields dedupe will pay attention to
@@ -112,7 +114,7 @@ if __name__ == '__main__':
              'categories': ['true', 'false']}]
 
         # Create a new deduper object and pass our data model to it.
-        deduper = dedupe.Dedupe(fields)
+        deduper = dedupe.Dedupe(fields, num_cores=4)
 
         # If we have training data saved from a previous run of dedupe,
         # look for it an load it in.
@@ -165,13 +167,9 @@ if __name__ == '__main__':
     for (cluster_id, cluster) in enumerate(clustered_dupes):
         id_set, scores = cluster
         for record_id, score in zip(id_set, scores):
-            cluster_membership[record_id] = {
-                "cluster id": cluster_id,
-                "confidence": score
-            }
+            cluster_membership[record_id] = (cluster_id, score)
 
     with open(output_file, 'w') as f_output:
-        writer = csv.writer(f_output)
 
         with open(input_file) as f_input:
 
@@ -181,7 +179,12 @@ if __name__ == '__main__':
             writer = csv.DictWriter(f_output, fieldnames=fieldnames)
             writer.writeheader()
 
-            for row in reader:
-                row_id = int(row['ID'])
-                row.update(cluster_membership[row_id])
-                writer.writerow(row)
+            def annotated_rows():
+                for row in reader:
+                    row_id = int(row['ID'])
+                    cluster_id, score = cluster_membership[row_id]
+                    row['cluster id'] = cluster_id
+                    row['confidence'] = score
+                    yield row
+
+            writer.writerows(annotated_rows())
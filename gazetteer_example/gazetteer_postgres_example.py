@@ -60,9 +60,11 @@ class StaticDatabaseGazetteer(dedupe.StaticGazetteer):
                 CREATE TABLE indexed_records
                 (block_key text, record_id INT, UNIQUE(block_key, record_id))
             ''')
-            cursor.executemany(
-                'INSERT INTO indexed_records VALUES (%s, %s)',
-                self.blocker(data.items(), target=True)
+            psycopg2.extras.execute_values(
+                cursor,
+                'INSERT INTO indexed_records VALUES %s',
+                self.blocker(data.items(), target=True),
+                page_size=10000
             )
             cursor.execute('''
                 CREATE INDEX IF NOT EXISTS
@@ -81,9 +83,11 @@ class StaticDatabaseGazetteer(dedupe.StaticGazetteer):
         """
         with conn.cursor() as cursor:
             cursor.execute('CREATE TEMPORARY TABLE blocking_map (block_key text, record_id INT)')
-            cursor.executemany(
-                'INSERT INTO blocking_map VALUES (%s, %s)',
-                self.blocker(messy_data.items(), target=True)
+            psycopg2.extras.execute_values(
+                cursor,
+                'INSERT INTO blocking_map VALUES %s',
+                self.blocker(messy_data.items(), target=True),
+                page_size=10000
             )
             cursor.execute('''
                 SELECT DISTINCT
@@ -147,7 +151,7 @@ def read_data_for_postgres(filename):
         writer.writeheader()
 
         for idx, row in enumerate(reader):
-            clean_row = dict([(k, preProcess(v)) for k, v in row.items()])
+            clean_row = {k: preProcess(v) for k, v in row.items()}
             if clean_row['price']:
                 clean_row['price'] = float(clean_row['price'][1:])
             if clean_row['unique_id']:
@@ -211,11 +215,16 @@ if __name__ == '__main__':
     else:
         # Define the fields the Gazetteer will pay attention to.
         print('\nSettings file %s does not exist, initializing training' % settings_file)
+
+        # Both Text fields index the same corpus; gather it once instead
+        # of walking both datasets once per field.
+        description_corpus = list(descriptions([messy, canonical]))
+
         fields = [
             {'field': 'title', 'type': 'String'},
-            {'field': 'title', 'type': 'Text', 'corpus': descriptions([messy, canonical])},
+            {'field': 'title', 'type': 'Text', 'corpus': description_corpus},
             {'field': 'description', 'type': 'Text',
-             'has missing': True, 'corpus': descriptions([messy, canonical])},
+             'has missing': True, 'corpus': description_corpus},
             {'field': 'price', 'type': 'Price', 'has missing': True}]
 
         # Create a new gazetteer object and pass our data model to it.
@@ -280,17 +289,15 @@ if __name__ == '__main__':
     # Update the messy data to assign the new matches.
     print('\nUpdating messy data with match IDs')
     with conn.cursor() as cursor:
-        counter = 0
-        for matches in results:
-            for (messy_id, canonical_id), score in matches:
-                cursor.execute('''
-                    UPDATE messy
-                    SET canonical_id = %s
-                    WHERE id = %s
-                ''', (int(canonical_id), int(messy_id))
-                )
-                counter += 1
-    print('Updated %d matches' % counter)
+        match_params = [(int(canonical_id), int(messy_id))
+                        for matches in results
+                        for (messy_id, canonical_id), score in matches]
+        psycopg2.extras.execute_batch(cursor, '''
+            UPDATE messy
+            SET canonical_id = %s
+            WHERE id = %s
+        ''', match_params)
+    print('Updated %d matches' % len(match_params))
 
     # Update the canonical dataset to insert any records that didn't have a
     # satisfactory match.
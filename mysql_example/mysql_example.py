@@ -30,7 +30,6 @@ import MySQLdb
 import MySQLdb.cursors
 
 import dedupe
-import dedupe.backport
 
 
 def record_pairs(result_set):
@@ -213,8 +212,15 @@ if __name__ == '__main__':
 
         with write_con.cursor() as write_cur:
 
-            write_cur.executemany("INSERT INTO blocking_map VALUES (%s, %s)",
-                                  b_data)
+            # MySQLdb's executemany materializes the whole iterable it is
+            # given, so feed it fixed-size batches. Peak memory is then
+            # bounded by the batch size instead of the full blocking map.
+            while True:
+                chunk = list(itertools.islice(b_data, 10000))
+                if not chunk:
+                    break
+                write_cur.executemany(
+                    "INSERT INTO blocking_map VALUES (%s, %s)", chunk)
 
     write_con.commit()
 
@@ -285,8 +291,11 @@ if __name__ == '__main__':
     write_con.commit()
     read_con.commit()
 
-    # Print out the number of duplicates found
-    print('# duplicate sets')
+    # Print out the number of duplicates found. Counting in the database
+    # keeps the entity map out of Python entirely.
+    with read_con.cursor() as cur:
+        cur.execute("SELECT COUNT(DISTINCT canon_id) AS n FROM entity_map")
+        print('# duplicate sets', cur.fetchone()['n'])
 
     # ## Payoff
 
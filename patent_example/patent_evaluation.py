@@ -4,16 +4,14 @@ import itertools
 
 def evaluateDuplicates(found_dupes, true_dupes):
     true_positives = found_dupes.intersection(true_dupes)
-    false_positives = found_dupes.difference(true_dupes)
-    uncovered_dupes = true_dupes.difference(found_dupes)
 
     print('found duplicate')
     print(len(found_dupes))
-         
+
     print(len(true_dupes))
-         
+
     print('precision')
-    print(1 - len(false_positives) / float(len(found_dupes)))
+    print(len(true_positives) / float(len(found_dupes)))
          
     print('recall')
     print(len(true_positives) / float(len(true_dupes)))
@@ -30,11 +28,10 @@ def dupePairs(filename, colname) :
     if 'x' in dupe_d :
         del dupe_d['x']
 
-    dupe_s = set([])
-    for (unique_id, cluster) in dupe_d.items():
-        if len(cluster) > 1:
-            for pair in itertools.combinations(cluster, 2):
-                dupe_s.add(frozenset(pair))
+    dupe_s = {frozenset(pair)
+              for cluster in dupe_d.values()
+              if len(cluster) > 1
+              for pair in itertools.combinations(cluster, 2)}
 
     return dupe_s
 
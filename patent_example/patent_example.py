@@ -84,7 +84,7 @@ if __name__ == '__main__':
 
     input_file = 'patstat_input.csv'
     output_file = 'patstat_output.csv'
-    settings_file = 'patstat_settings.json'
+    settings_file = 'patstat_settings'
     training_file = 'patstat_training.json'
 
     print('importing data ...')
@@ -173,10 +173,7 @@ if __name__ == '__main__':
     cluster_membership = {}
     for cluster_id, (records, scores) in enumerate(clustered_dupes):
         for record_id, score in zip(records, scores):
-            cluster_membership[record_id] = {
-                "Cluster ID": cluster_id,
-                "confidence_score": score
-            }
+            cluster_membership[record_id] = (cluster_id, score)
 
     with open(output_file, 'w') as f_output, open(input_file) as f_input:
 
@@ -186,6 +183,11 @@ if __name__ == '__main__':
         writer = csv.DictWriter(f_output, fieldnames=fieldnames)
         writer.writeheader()
 
-        for row_id, row in enumerate(reader):
-            row.update(cluster_membership[row_id])
-            writer.writerow(row)
+        def annotated_rows():
+            for row_id, row in enumerate(reader):
+                cluster_id, score = cluster_membership[row_id]
+                row['Cluster ID'] = cluster_id
+                row['confidence_score'] = score
+                yield row
+
+        writer.writerows(annotated_rows())
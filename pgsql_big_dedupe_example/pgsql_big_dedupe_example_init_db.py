@@ -58,7 +58,7 @@ if not os.path.exists(contributions_csv_file):
     ) as csv_file:
         csv_writer = csv.writer(csv_file, quoting=csv.QUOTE_ALL)
         for line in txt_file:
-            if not all(ord(c) < 128 for c in line):
+            if not line.isascii():
                 line = unidecode.unidecode(line)
             row = line.rstrip("\t\r\n").split("\t")
             if len(row) != 29:
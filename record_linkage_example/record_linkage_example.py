@@ -13,25 +13,34 @@ import csv
 import re
 import logging
 import optparse
+import functools
 
 import dedupe
 from unidecode import unidecode
 
 
+# Characters we drop outright, characters we turn into spaces, and runs
+# of spaces to collapse. Grouping them into character classes lets each
+# column be scanned three times instead of seven.
+PUNCT_REMOVE_RE = re.compile("[-',]")
+PUNCT_SPACE_RE = re.compile('[\n/:]')
+MULTI_SPACE_RE = re.compile('  +')
+
+
+@functools.lru_cache(maxsize=None)
 def preProcess(column):
     """
     Do a little bit of data cleaning with the help of Unidecode and Regex.
     Things like casing, extra spaces, quotes and new lines can be ignored.
+
+    Product listings repeat manufacturer names and boilerplate between
+    the two stores, so the cleaning is memoized on the raw string.
     """
 
     column = unidecode(column)
-    column = re.sub('\n', ' ', column)
-    column = re.sub('-', '', column)
-    column = re.sub('/', ' ', column)
-    column = re.sub("'", '', column)
-    column = re.sub(",", '', column)
-    column = re.sub(":", ' ', column)
-    column = re.sub('  +', ' ', column)
+    column = PUNCT_REMOVE_RE.sub('', column)
+    column = PUNCT_SPACE_RE.sub(' ', column)
+    column = MULTI_SPACE_RE.sub(' ', column)
     column = column.strip().strip('"').strip("'").lower().strip()
     if not column:
         column = None
@@ -49,10 +58,10 @@ def readData(filename):
     with open(filename) as f:
         reader = csv.DictReader(f)
         for i, row in enumerate(reader):
-            clean_row = dict([(k, preProcess(v)) for (k, v) in row.items()])
+            clean_row = {k: preProcess(v) for (k, v) in row.items()}
             if clean_row['price']:
                 clean_row['price'] = float(clean_row['price'][1:])
-            data_d[filename + str(i)] = dict(clean_row)
+            data_d[filename + str(i)] = clean_row
 
     return data_d
 
@@ -89,32 +98,34 @@ if __name__ == '__main__':
     data_1 = readData(left_file)
     data_2 = readData(right_file)
 
-    def descriptions():
-        for dataset in (data_1, data_2):
-            for record in dataset.values():
-                yield record['description']
-
     # ## Training
 
     if os.path.exists(settings_file):
         print('reading from', settings_file)
         with open(settings_file, 'rb') as sf:
-            linker = dedupe.StaticRecordLink(sf)
+            linker = dedupe.StaticRecordLink(sf, num_cores=4)
 
     else:
+        # Both Text fields index the same corpus, so gather the
+        # descriptions once and hand the same sequence to each field
+        # rather than walking both datasets once per field.
+        description_corpus = [record['description']
+                              for dataset in (data_1, data_2)
+                              for record in dataset.values()]
+
         # Define the fields the linker will pay attention to
         #
         # Notice how we are telling the linker to use a custom field comparator
         # for the 'price' field.
         fields = [
             {'field': 'title', 'type': 'String'},
-            {'field': 'title', 'type': 'Text', 'corpus': descriptions()},
+            {'field': 'title', 'type': 'Text', 'corpus': description_corpus},
             {'field': 'description', 'type': 'Text',
-             'has missing': True, 'corpus': descriptions()},
+             'has missing': True, 'corpus': description_corpus},
             {'field': 'price', 'type': 'Price', 'has missing': True}]
 
         # Create a new linker object and pass our data model to it.
-        linker = dedupe.RecordLink(fields)
+        linker = dedupe.RecordLink(fields, num_cores=4)
 
         # If we have training data saved from a previous run of linker,
         # look for it an load it in.
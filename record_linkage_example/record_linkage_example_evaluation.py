@@ -1,18 +1,15 @@
 import csv
 import collections
 import itertools
-import os
 
 def evaluateDuplicates(found_dupes, true_dupes):
     true_positives = found_dupes.intersection(true_dupes)
-    false_positives = found_dupes.difference(true_dupes)
-    uncovered_dupes = true_dupes.difference(found_dupes)
 
     print('found duplicate')
     print(len(found_dupes))
 
     print('precision')
-    print(1 - len(false_positives) / float(len(found_dupes)))
+    print(len(true_positives) / float(len(found_dupes)))
 
     print('recall')
     print(len(true_positives) / float(len(true_dupes)))
@@ -31,11 +28,10 @@ def linkPairs(filename, rowname) :
 
                 link_d[link_id][source_file].append(i)
 
-    link_s = set()
-
-    for members in link_d.values():
-        for pair in itertools.product(*members.values()):
-            link_s.add(frozenset(pair))
+    link_s = {frozenset(pair)
+              for members in link_d.values()
+              if len(members) > 1
+              for pair in itertools.product(*members.values())}
 
     return link_s
 